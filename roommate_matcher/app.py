@@ -6,6 +6,7 @@ from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 import sqlite3
+import threading
 from datetime import datetime
 
 st.markdown(
@@ -101,7 +102,8 @@ def load_data():
                 'NoiseTolerance': df_db['noise_tolerance'],
                 'Gender': df_db['gender'].str.replace('👨 Male', 'Male', regex=True)
                                          .str.replace('👩 Female', 'Female', regex=True),
-                'IdealRoommate': df_db['looking_for'].fillna('Looking for a compatible roommate') if 'looking_for' in df_db.columns else 'Looking for a compatible roommate'
+                'IdealRoommate': df_db['looking_for'].fillna('Looking for a compatible roommate') if 'looking_for' in df_db.columns else 'Looking for a compatible roommate',
+                'UserKey': df_db['roll_number']
             })
             
             return df_formatted
@@ -116,7 +118,8 @@ def load_data():
                 'StudyTime': [],
                 'NoiseTolerance': [],
                 'Gender': [],
-                'IdealRoommate': []
+                'IdealRoommate': [],
+                'UserKey': []
             })
             
     except Exception as e:
@@ -131,12 +134,15 @@ def load_data():
             'StudyTime': [],
             'NoiseTolerance': [],
             'Gender': [],
-            'IdealRoommate': []
+            'IdealRoommate': [],
+            'UserKey': []
         })
 
-df = load_data()
-
 # ------------------ Database Setup ------------------
+def make_user_key(roll_number):
+    # Roll numbers identify a student; ignore spacing and case differences when typed
+    return ''.join(roll_number.split()).upper()
+
 def init_database():
     conn = sqlite3.connect('roommate_submissions.db')
     cursor = conn.cursor()
@@ -152,7 +158,8 @@ def init_database():
             cleanliness INTEGER NOT NULL,
             noise_tolerance INTEGER NOT NULL,
             intro_extro REAL NOT NULL,
-            submission_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            submission_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            roll_number TEXT
         )
     ''')
     
@@ -161,16 +168,75 @@ def init_database():
         cursor.execute("ALTER TABLE submissions ADD COLUMN looking_for TEXT DEFAULT '🤝 Any Gender'")
     except sqlite3.OperationalError:
         pass  # Column already exists
-    conn.commit()
+
+    # Indexes for newest-first listing and the filters in view_database.py
+    # (id is the rowid, so each one also carries it as a tie-breaker)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_submissions_time ON submissions (submission_time)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_submissions_gender_time ON submissions (gender, submission_time)")
+    for column in ['wakeup', 'sleep', 'study_time']:
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_submissions_{column}_time ON submissions ({column}, submission_time)")
+
+    # Add roll_number column if it doesn't exist (for existing databases)
+    try:
+        cursor.execute("ALTER TABLE submissions ADD COLUMN roll_number TEXT")
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+
+    index_query = "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_submissions_roll_number'"
+    if cursor.execute(index_query).fetchone() is None:
+        # Take the write lock and check again so only one session runs the migration
+        cursor.execute("BEGIN IMMEDIATE")
+        if cursor.execute(index_query).fetchone() is None:
+            compact_submissions(cursor)
+            cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_submissions_roll_number ON submissions (roll_number)")
+        conn.commit()
     conn.close()
 
-def save_submission(name, gender, looking_for, wakeup, sleep, study_time, cleanliness, noise_tolerance, intro_extro):
+def compact_submissions(cursor):
+    # One-time migration: keep each student's latest submission. Older rows have no
+    # roll number, so they are only merged when every answer is identical.
+    cursor.execute('''
+        CREATE TEMP TABLE duplicate_ids AS
+        SELECT id FROM (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY roll_number ORDER BY submission_time DESC, id DESC
+            ) AS rn
+            FROM submissions WHERE roll_number IS NOT NULL
+            UNION ALL
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY name, gender, looking_for, wakeup, sleep, study_time,
+                             cleanliness, noise_tolerance, intro_extro
+                ORDER BY submission_time DESC, id DESC
+            ) AS rn
+            FROM submissions WHERE roll_number IS NULL
+        )
+        WHERE rn > 1
+    ''')
+    # Keep a copy of everything removed
+    cursor.execute("CREATE TABLE IF NOT EXISTS submissions_backup AS SELECT * FROM submissions WHERE 0")
+    cursor.execute("INSERT INTO submissions_backup SELECT * FROM submissions WHERE id IN (SELECT id FROM duplicate_ids)")
+    cursor.execute("DELETE FROM submissions WHERE id IN (SELECT id FROM duplicate_ids)")
+    cursor.execute("DROP TABLE duplicate_ids")
+
+def save_submission(name, roll_number, gender, looking_for, wakeup, sleep, study_time, cleanliness, noise_tolerance, intro_extro):
     conn = sqlite3.connect('roommate_submissions.db')
     cursor = conn.cursor()
     cursor.execute('''
-        INSERT INTO submissions (name, gender, looking_for, wakeup, sleep, study_time, cleanliness, noise_tolerance, intro_extro)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (name, gender, looking_for, wakeup, sleep, study_time, cleanliness, noise_tolerance, intro_extro))
+        INSERT INTO submissions (name, gender, looking_for, wakeup, sleep, study_time, cleanliness, noise_tolerance, intro_extro, roll_number)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (roll_number) DO UPDATE SET
+            name = excluded.name,
+            gender = excluded.gender,
+            looking_for = excluded.looking_for,
+            wakeup = excluded.wakeup,
+            sleep = excluded.sleep,
+            study_time = excluded.study_time,
+            cleanliness = excluded.cleanliness,
+            noise_tolerance = excluded.noise_tolerance,
+            intro_extro = excluded.intro_extro,
+            submission_time = CURRENT_TIMESTAMP
+    ''', (name, gender, looking_for, wakeup, sleep, study_time, cleanliness, noise_tolerance, intro_extro,
+          make_user_key(roll_number)))
     conn.commit()
     conn.close()
 
@@ -192,20 +258,57 @@ def get_submission_count():
 init_database()
 
 # ------------------ Preprocessing ------------------
-features = df[['Wakeup', 'Sleep', 'Cleanliness', 'IntroExtro', 'StudyTime', 'NoiseTolerance']]
+FEATURE_COLUMNS = ['Wakeup', 'Sleep', 'Cleanliness', 'IntroExtro', 'StudyTime', 'NoiseTolerance']
+
+def fit_matcher(df):
+    preprocessor = ColumnTransformer(transformers=[
+        ('cat', OneHotEncoder(), ['Wakeup', 'Sleep', 'StudyTime',]),
+        ('num', StandardScaler(), ['Cleanliness', 'IntroExtro', 'NoiseTolerance'])
+    ])
+    X = preprocessor.fit_transform(df[FEATURE_COLUMNS])
+    return preprocessor, X
+
+@st.cache_resource
+def load_matcher():
+    # Built once per server process and shared by every session; upsert_user keeps it current
+    df = load_data()
+    preprocessor, X = fit_matcher(df)
+    return {'df': df, 'preprocessor': preprocessor, 'X': X, 'lock': threading.Lock()}
+
+def upsert_user(matcher, user_row):
+    # Mirror save_submission in memory: replace a returning user's row and vector, or append a new one
+    with matcher['lock']:
+        df = matcher['df']
+        try:
+            vector = matcher['preprocessor'].transform(user_row[FEATURE_COLUMNS])
+        except ValueError:
+            vector = None  # Category the preprocessor hasn't seen yet
+
+        existing = np.flatnonzero(df['UserKey'] == user_row.loc[0, 'UserKey'])
+        if len(existing) > 0:
+            for column in user_row.columns:
+                df.loc[existing[0], column] = user_row.loc[0, column]
+            if vector is not None:
+                matcher['X'][existing[0]] = vector[0]
+        else:
+            df = pd.concat([df, user_row], ignore_index=True)
+            if vector is not None:
+                matcher['X'] = np.vstack([matcher['X'], vector])
 
-preprocessor = ColumnTransformer(transformers=[
-    ('cat', OneHotEncoder(), ['Wakeup', 'Sleep', 'StudyTime',]),
-    ('num', StandardScaler(), ['Cleanliness', 'IntroExtro', 'NoiseTolerance'])
-])
+        if vector is None:
+            matcher['preprocessor'], matcher['X'] = fit_matcher(df)
+            vector = matcher['preprocessor'].transform(user_row[FEATURE_COLUMNS])
+        matcher['df'] = df
+        return vector
 
-X = preprocessor.fit_transform(features)
+matcher = load_matcher()
+df, preprocessor, X = matcher['df'], matcher['preprocessor'], matcher['X']
 
 # ------------------ Matching Logic ------------------
 def find_top_matches(user_input_vector, top_n=3):
     sim_scores = cosine_similarity(user_input_vector, X)[0]
     top_indices = np.argsort(sim_scores)[::-1][:top_n]
-    results = [(df.iloc[i]['Name'], round(sim_scores[i]*100, 2)) for i in top_indices]
+    results = [(i, df.iloc[i]['Name'], round(sim_scores[i]*100, 2)) for i in top_indices]
     return results
 
 # ------------------ Streamlit UI ------------------
@@ -226,6 +329,11 @@ with st.sidebar:
                            help="This will be stored in our database",
                            key="user_name")
         
+        roll_number = st.text_input("🎓 Roll Number", 
+                                  placeholder="Enter your roll number",
+                                  help="Used to recognise you when you update your answers",
+                                  key="user_roll_number")
+        
         gender = st.selectbox("🚻 Your Gender", 
                             ["👨 Male", "👩 Female"],
                             help="Select your gender",
@@ -344,6 +452,11 @@ else:
         st.error("❌ Please enter your name before finding matches!")
         st.stop()
     
+    # Validate that roll number is provided
+    if not roll_number or roll_number.strip() == "":
+        st.error("❌ Please enter your roll number before finding matches!")
+        st.stop()
+    
     # Validate that looking_for is provided
     if not looking_for or looking_for.strip() == "":
         st.warning("💡 Consider describing what you're looking for in a roommate for better visibility!")
@@ -367,10 +480,27 @@ else:
         "🌙 Night": "Night"
     }
     
+    # Map gender for filtering (back to same-gender matching)
+    gender_map = {
+        "👨 Male": "Male",
+        "👩 Female": "Female"
+    }
+    
+    # Create new user input row
+    new_user = pd.DataFrame([{
+        'Wakeup': wakeup_map[wakeup],
+        'Sleep': sleep_map[sleep],
+        'Cleanliness': cleanliness,
+        'IntroExtro': intro_extro,
+        'StudyTime': study_map[study_time],
+        'NoiseTolerance': noise_tolerance,
+    }])
+
     # Save user submission to database
     try:
         save_submission(
             name.strip(),
+            roll_number,
             gender,
             looking_for.strip() if looking_for else "",
             wakeup,
@@ -380,52 +510,38 @@ else:
             noise_tolerance,
             intro_extro
         )
-        st.success(f"✅ Welcome {name.strip()}! Your information has been saved.")
-        
-        # Reload data to include new submission
-        df = load_data()
-        
-        # Update features and preprocessor with new data
-        features = df[['Wakeup', 'Sleep', 'Cleanliness', 'IntroExtro', 'StudyTime', 'NoiseTolerance']]
-        
-        preprocessor = ColumnTransformer(transformers=[
-            ('cat', OneHotEncoder(), ['Wakeup', 'Sleep', 'StudyTime']),
-            ('num', StandardScaler(), ['Cleanliness', 'IntroExtro', 'NoiseTolerance'])
-        ])
-        
-        X = preprocessor.fit_transform(features)
-        
     except Exception as e:
         st.warning("⚠️ Could not save your information to database, but proceeding with matching.")
+        new_user_processed = preprocessor.transform(new_user)
+    else:
+        st.success(f"✅ Welcome {name.strip()}! Your information has been saved.")
+        
+        # Update the shared matcher in place instead of reloading the whole table
+        user_row = new_user.assign(
+            Name=name.strip(),
+            Gender=gender_map[gender],
+            IdealRoommate=looking_for.strip() if looking_for else "",
+            UserKey=make_user_key(roll_number)
+        )
+        new_user_processed = upsert_user(matcher, user_row)
+        df, preprocessor, X = matcher['df'], matcher['preprocessor'], matcher['X']
     
-    # Create new user input row
-    new_user = pd.DataFrame([{
-        'Wakeup': wakeup_map[wakeup],
-        'Sleep': sleep_map[sleep],
-        'Cleanliness': cleanliness,
-        'IntroExtro': intro_extro,
-        'StudyTime': study_map[study_time],
-        'NoiseTolerance': noise_tolerance,
-    }])
-
-    new_user_processed = preprocessor.transform(new_user)
     all_matches = find_top_matches(new_user_processed, top_n=20)  # Get more matches for filtering
     
-    # Map gender for filtering (back to same-gender matching)
-    gender_map = {
-        "👨 Male": "Male",
-        "👩 Female": "Female"
-    }
-    
     user_gender = gender_map[gender]
     
     # Filter matches by same gender and exclude current user
     filtered_matches = []
-    for match_name, score in all_matches:
-        person_gender = df[df['Name'] == match_name]['Gender'].iloc[0]
+    for row, match_name, score in all_matches:
+        person = df.iloc[row]
+        # Older submissions have no roll number, so fall back to the name for them
+        if pd.notna(person['UserKey']):
+            is_current_user = person['UserKey'] == make_user_key(roll_number)
+        else:
+            is_current_user = match_name.strip() == name.strip()
         # Include only same gender matches and exclude current user
-        if match_name.strip() != name.strip() and person_gender == user_gender:
-            filtered_matches.append((match_name, score))
+        if not is_current_user and person['Gender'] == user_gender:
+            filtered_matches.append((row, match_name, score))
     
     # Take top 3 same-gender matches
     matches = filtered_matches[:3]
@@ -452,9 +568,9 @@ else:
     st.markdown("---")
     
     # Display each match in a nice card format
-    for i, (name, score) in enumerate(matches, 1):
+    for i, (row, name, score) in enumerate(matches, 1):
         # Get detailed info for this person
-        person_info = df[df['Name'] == name].iloc[0]
+        person_info = df.iloc[row]
         
         # Create columns for better layout
         col1, col2 = st.columns([1, 3])
@@ -7,40 +7,215 @@ import sqlite3
 import pandas as pd
 from datetime import datetime
 
-def view_submissions():
-    """View all submissions from the database"""
+DB_PATH = 'roommate_submissions.db'
+PAGE_SIZE = 10
+
+# Category columns that can be filtered on and summarised
+CATEGORY_COLUMNS = ['wakeup', 'sleep', 'study_time']
+
+# Lifestyle columns shown as histograms in the summary
+HISTOGRAM_COLUMNS = {
+    'cleanliness': "🧼 Cleanliness",
+    'noise_tolerance': "🔊 Noise Tolerance",
+    'intro_extro': "💬 Social Level",
+}
+
+GENDER_LABELS = {
+    'male': "👨 Male",
+    'female': "👩 Female",
+}
+
+# Short names for each category value, matching the labels stored by the app
+CATEGORY_LABELS = {
+    'wakeup': {
+        'early': "🐓 Early (6–8 AM)",
+        'mid': "😴 Mid (9–11 AM)",
+        'late': "🦥 Late (12 PM or later)",
+    },
+    'sleep': {
+        'early': "🌌 Early (Before 11 PM)",
+        'mid': "🕰️ Mid (11 PM – 1 AM)",
+        'late': "🌃 Late (2 AM or later)",
+    },
+    'study_time': {
+        'morning': "☀️ Morning",
+        'night': "🌙 Night",
+    },
+}
+
+def connect():
+    """Open the database read-only; app.py owns the schema and its indexes"""
+    return sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+
+def parse_date(text):
+    """Check a YYYY-MM-DD date and return it in the stored format"""
     try:
-        conn = sqlite3.connect('roommate_submissions.db')
-        
-        # Get all submissions
-        df = pd.read_sql_query("SELECT * FROM submissions ORDER BY submission_time DESC", conn)
-        
-        if len(df) > 0:
+        return datetime.strptime(text.strip(), '%Y-%m-%d').strftime('%Y-%m-%d')
+    except ValueError:
+        raise ValueError(f"Invalid date '{text}', expected YYYY-MM-DD")
+
+def build_filters(gender=None, start_date=None, end_date=None, category=None, value=None):
+    """Build a WHERE clause and its parameters from the given filters"""
+    clauses = []
+    params = []
+
+    if gender:
+        key = gender.strip().lower()
+        if key not in GENDER_LABELS:
+            raise ValueError(f"Unknown gender '{gender}', expected one of {', '.join(GENDER_LABELS)}")
+        clauses.append("gender = ?")
+        params.append(GENDER_LABELS[key])
+    if start_date:
+        clauses.append("submission_time >= ?")
+        params.append(parse_date(start_date))
+    if end_date:
+        # End date is inclusive of the whole day
+        clauses.append("submission_time < date(?, '+1 day')")
+        params.append(parse_date(end_date))
+    if category:
+        if category not in CATEGORY_COLUMNS:
+            raise ValueError(f"Unknown category '{category}', expected one of {', '.join(CATEGORY_COLUMNS)}")
+        if not value:
+            raise ValueError(f"Category '{category}' needs a value")
+        labels = CATEGORY_LABELS[category]
+        key = value.strip().lower()
+        if key not in labels:
+            raise ValueError(f"Unknown {category} value '{value}', expected one of {', '.join(labels)}")
+        clauses.append(f"{category} = ?")
+        params.append(labels[key])
+
+    where = " AND ".join(clauses) if clauses else "1"
+    return where, params
+
+def fetch_page(conn, where="1", params=(), after=None, page_size=PAGE_SIZE):
+    """Fetch one page of submissions, newest first.
+
+    ``after`` is the (submission_time, id) of the last row on the previous
+    page. Seeking past it keeps every page as cheap as the first, unlike
+    OFFSET which has to walk over all the skipped rows.
+    """
+    sql = f"SELECT * FROM submissions WHERE {where}"
+    params = list(params)
+    if after is not None:
+        sql += " AND (submission_time, id) < (?, ?)"
+        params.extend(after)
+    sql += " ORDER BY submission_time DESC, id DESC LIMIT ?"
+    # One extra row tells us whether another page exists
+    params.append(page_size + 1)
+
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    rows = cursor.execute(sql, params).fetchall()
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, (rows[-1]['submission_time'], rows[-1]['id'])
+
+def get_summary(conn, where="1", params=()):
+    """Count submissions per category and bucket lifestyle values with GROUP BY"""
+    summary = {
+        'total': conn.execute(f"SELECT COUNT(*) FROM submissions WHERE {where}", params).fetchone()[0],
+        'gender': conn.execute(
+            f"SELECT gender, COUNT(*) FROM submissions WHERE {where} GROUP BY gender ORDER BY 2 DESC", params
+        ).fetchall(),
+    }
+    for column in CATEGORY_COLUMNS:
+        summary[column] = conn.execute(
+            f"SELECT {column}, COUNT(*) FROM submissions WHERE {where} GROUP BY {column} ORDER BY 2 DESC", params
+        ).fetchall()
+    for column in HISTOGRAM_COLUMNS:
+        # Social level is 0.0-1.0, so bucket it into tenths
+        bucket = "ROUND(intro_extro, 1)" if column == 'intro_extro' else column
+        summary[column] = conn.execute(
+            f"SELECT {bucket} AS bucket, COUNT(*) FROM submissions WHERE {where} GROUP BY bucket ORDER BY bucket", params
+        ).fetchall()
+    return summary
+
+def print_submission(row):
+    """Print a single submission"""
+    print(f"🆔 ID: {row['id']}")
+    print(f"👤 Name: {row['name']}")
+    print(f"🚻 Gender: {row['gender']}")
+    print(f"🌅 Wake-up: {row['wakeup']}")
+    print(f"🌙 Sleep: {row['sleep']}")
+    print(f"📚 Study Time: {row['study_time']}")
+    print(f"🧼 Cleanliness: {row['cleanliness']}/5")
+    print(f"🔊 Noise Tolerance: {row['noise_tolerance']}/5")
+    print(f"💬 Social Level: {row['intro_extro']}")
+    print(f"📅 Submitted: {row['submission_time']}")
+    print("-" * 30)
+
+def prompt_filters():
+    """Ask for optional filters; blank answers are skipped"""
+    gender = input("Gender (male/female, blank for any): ").strip() or None
+    start_date = input("From date (YYYY-MM-DD, blank for any): ").strip() or None
+    end_date = input("To date (YYYY-MM-DD, blank for any): ").strip() or None
+    category = input(f"Category ({'/'.join(CATEGORY_COLUMNS)}, blank for none): ").strip().lower() or None
+    choices = '/'.join(CATEGORY_LABELS.get(category, {}))
+    value = input(f"Category value ({choices}): ").strip() if category else None
+    return build_filters(gender, start_date, end_date, category, value)
+
+def view_submissions(where="1", params=()):
+    """View submissions from the database one page at a time"""
+    try:
+        conn = connect()
+
+        total = conn.execute(f"SELECT COUNT(*) FROM submissions WHERE {where}", params).fetchone()[0]
+
+        if total > 0:
             print(f"\n📊 ROOMMATE SUBMISSIONS DATABASE")
             print(f"{'='*50}")
-            print(f"Total submissions: {len(df)}")
+            print(f"Total submissions: {total}")
             print(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             print(f"{'='*50}\n")
-            
-            # Display each submission
-            for index, row in df.iterrows():
-                print(f"🆔 ID: {row['id']}")
-                print(f"👤 Name: {row['name']}")
-                print(f"🚻 Gender: {row['gender']}")
-                print(f"🌅 Wake-up: {row['wakeup']}")
-                print(f"🌙 Sleep: {row['sleep']}")
-                print(f"📚 Study Time: {row['study_time']}")
-                print(f"🧼 Cleanliness: {row['cleanliness']}/5")
-                print(f"🔊 Noise Tolerance: {row['noise_tolerance']}/5")
-                print(f"💬 Social Level: {row['intro_extro']}")
-                print(f"📅 Submitted: {row['submission_time']}")
-                print("-" * 30)
-                
+
+            after = None
+            while True:
+                rows, after = fetch_page(conn, where, params, after)
+                for row in rows:
+                    print_submission(row)
+                if after is None:
+                    break
+                if input("Press Enter for the next page, or q to stop: ").strip().lower() == "q":
+                    break
+
+        elif where != "1":
+            print("No submissions match these filters.")
         else:
             print("No submissions found in database.")
-            
+
         conn.close()
-        
+
+    except sqlite3.Error as e:
+        print(f"Database error: {e}")
+    except Exception as e:
+        print(f"Error: {e}")
+
+def view_summary(where="1", params=()):
+    """Print per-category counts and lifestyle histograms"""
+    try:
+        conn = connect()
+        summary = get_summary(conn, where, params)
+        conn.close()
+
+        print(f"\n📈 SUBMISSION SUMMARY")
+        print(f"{'='*50}")
+        print(f"Total submissions: {summary['total']}")
+        print(f"{'='*50}")
+
+        for column in ['gender'] + CATEGORY_COLUMNS:
+            print(f"\n{column.replace('_', ' ').title()}:")
+            for label, count in summary[column]:
+                print(f"  {label}: {count}")
+
+        for column, title in HISTOGRAM_COLUMNS.items():
+            print(f"\n{title}:")
+            largest = max((count for _, count in summary[column]), default=0)
+            for bucket, count in summary[column]:
+                # Scale bars so big tables still fit on one line
+                bar = '█' * max(1, round(count * 40 / largest))
+                print(f"  {bucket:>4} | {bar} {count}")
+
     except sqlite3.Error as e:
         print(f"Database error: {e}")
     except Exception as e:
@@ -49,34 +224,46 @@ def view_submissions():
 def export_to_csv():
     """Export submissions to CSV file"""
     try:
-        conn = sqlite3.connect('roommate_submissions.db')
+        conn = connect()
         df = pd.read_sql_query("SELECT * FROM submissions ORDER BY submission_time DESC", conn)
-        
+
         if len(df) > 0:
             filename = f"roommate_submissions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             df.to_csv(filename, index=False)
             print(f"✅ Data exported to {filename}")
         else:
             print("No data to export.")
-            
+
         conn.close()
-        
+
     except Exception as e:
         print(f"Export error: {e}")
 
 if __name__ == "__main__":
     print("Roommate Database Viewer")
     print("1. View all submissions")
-    print("2. Export to CSV")
-    print("3. Exit")
-    
-    choice = input("\nEnter your choice (1-3): ")
-    
+    print("2. Search submissions (gender / date / category)")
+    print("3. Summary (gender / date / category)")
+    print("4. Export to CSV")
+    print("5. Exit")
+
+    choice = input("\nEnter your choice (1-5): ")
+
     if choice == "1":
         view_submissions()
     elif choice == "2":
-        export_to_csv()
+        try:
+            view_submissions(*prompt_filters())
+        except ValueError as e:
+            print(f"Error: {e}")
     elif choice == "3":
+        try:
+            view_summary(*prompt_filters())
+        except ValueError as e:
+            print(f"Error: {e}")
+    elif choice == "4":
+        export_to_csv()
+    elif choice == "5":
         print("Goodbye!")
     else:
-        print("Invalid choice!") 
\ No newline at end of file
+        print("Invalid choice!")